@@ -8,17 +8,48 @@ from rounded_rect import RoundedRect
 
 BLINKING_SPEED = 0.05 # Radians per frame
 BRIGHTNESS_HIGH = 2.0 # High brightness factor (must be greater than 1.0)
+BLINKING_STEPS = 64 # Brightness lookup table size (per half of sine period)
+
+# Brightness factors indexed by blinking phase
+BRIGHTNESS_TABLE = [1 + (BRIGHTNESS_HIGH - 1)
+                    * math.sin(math.pi * i / BLINKING_STEPS)
+                    for i in range(BLINKING_STEPS)]
+BRIGHTEST_STEP = BLINKING_STEPS // 2
+
+# Palette indexes of the blinking shape
+PALETTE_TRANSPARENT = 0
+PALETTE_BORDER = 1
+PALETTE_MAIN = 2
 
 class BlinkingRect(RoundedRect):
     """The BlinkingRect class adds blinking feature to the RoundedRect class.
     The bright ('blinking') color is auto-calculated.
+
+    The blinking shape is rendered once into an 8-bit palettized surface.
+    Every frame only the border and the main color palette entries are
+    rewritten from lookup tables of bright colors, so the blinking cost
+    doesn't depend on the shape's size.
     """
+    __slots__ = ('blinking', 'sprite', 'sprite_key', 'palettes')
+
+    animated = True # Class-wide setting: False for steady bright color
+
     def __init__(self, width: int, height: int, color: tuple):
         """The parameters are exactly the same as for RoundedRect constructor.
         """
         super().__init__(width, height, color)
 
         self.blinking = None
+        self.sprite = None
+        self.sprite_key = None
+
+        # Bright colors indexed by blinking phase
+        self.palettes = {
+            PALETTE_BORDER: [self._adjust_brightness(self.border_color, k)
+                             for k in BRIGHTNESS_TABLE],
+            PALETTE_MAIN: [self._adjust_brightness(self.color, k)
+                           for k in BRIGHTNESS_TABLE],
+        }
 
     def start_blinking(self):
         """Starts blinking animation.
@@ -43,20 +74,42 @@ class BlinkingRect(RoundedRect):
             if self.blinking >= math.pi:
                 self.blinking -= math.pi
 
-    def draw(self):
-        """Draws blinking rounded rectangle.
+    def draw(self, surface: pygame.Surface = None):
+        """Draws blinking rounded rectangle. The parameters are exactly
+        the same as for RoundedRect.draw() method.
         """
-        if self.blinking != None:
-            old_color, old_border_color = self.color, self.border_color
-            self.color = [self._adjust_brightness(i) for i in old_color]
-            self.border_color = [self._adjust_brightness(i)
-                                 for i in old_border_color]
-            super().draw()
-            self.color, self.border_color = old_color, old_border_color
+        if self.blinking == None:
+            super().draw(surface)
+            return
+
+        if self.animated:
+            step = int(self.blinking / math.pi * BLINKING_STEPS)
+            step %= BLINKING_STEPS
         else:
-            super().draw()
+            step = BRIGHTEST_STEP
+
+        sprite = self._get_sprite()
+        for index, palette in self.palettes.items():
+            sprite.set_palette_at(index, palette[step])
+
+        ds = surface or pygame.display.get_surface()
+        ds.blit(sprite, self.rect)
+
+    # Returns the shape rendered into 8-bit palettized surface (the shape is
+    # rendered again only if its size or rounding setting has changed)
+    def _get_sprite(self) -> pygame.Surface:
+        key = (self.rect.size, self.rounded)
+        if self.sprite_key != key:
+            self.sprite = pygame.Surface(self.rect.size, 0, 8)
+            self.sprite.fill(PALETTE_TRANSPARENT)
+            self.sprite.set_colorkey(PALETTE_TRANSPARENT)
+            self._draw_shape(self.sprite, self.sprite.get_rect(),
+                             PALETTE_MAIN, PALETTE_BORDER)
+            self.sprite_key = key
+
+        return self.sprite
 
-    # Returns color component with brightness altered (for blinking effect)
-    def _adjust_brightness(self, color: int) -> int:
-        return min(int(color + color * (BRIGHTNESS_HIGH - 1)
-                       * abs(math.sin(self.blinking))), 255)
+    # Returns color with brightness altered by a given factor (for blinking
+    # effect)
+    def _adjust_brightness(self, color: tuple, factor: float) -> tuple:
+        return tuple(min(int(i * factor), 255) for i in color)
@@ -0,0 +1,73 @@
+"""Module for implementation the Board class.
+"""
+from trajectory_cache import TrajectoryCache
+
+class Board():
+    """The Board class represents a lightweight puzzle state which autoplays
+    a given sequence of moves. Boards are used by BoardGrid for running many
+    independent puzzles at once, so disks are stored just as integer indexes
+    (0 for the largest one) and no graphical objects are kept per board.
+
+    Public attributes:
+        stacks: list(list(int)) (read only) - disk indexes strung on each rod
+            (from bottom to top);
+        position: int (read only) - the index of the next move to play;
+        flight: tuple(disk: int, target: int, path: numpy.ndarray,
+            frame: int) (read only) - the disk moving animation in progress
+            (or None).
+    """
+    def __init__(self, disks_count: int, towers_count: int, moves: list,
+                 position: int = 0):
+        """Input:
+            disks_count - integer number of disks;
+            towers_count - integer number of rods;
+            moves - a list of tuple(source: int, target: int) move
+                representations to be played (may be shared among boards);
+            position - integer index of the first move to play.
+        """
+        self.disks_count = disks_count
+        self.towers_count = towers_count
+        self.moves = moves
+        self.restart(position)
+
+    def restart(self, position: int = 0):
+        """Restores initial disks position and instantly plays the moves
+        preceding a given one.
+
+        Input:
+            position - integer index of the first move to animate.
+        """
+        self.stacks = [[] for i in range(self.towers_count)]
+        self.stacks[0] = list(range(self.disks_count))
+        for source, target in self.moves[:position]:
+            self.stacks[target].append(self.stacks[source].pop())
+
+        self.position = position
+        self.flight = None
+
+    def update(self, trajectories: TrajectoryCache):
+        """Advances the autoplay by one frame. Should be called every frame.
+
+        Input:
+            trajectories - TrajectoryCache object for disk flight paths.
+        """
+        if self.flight:
+            disk, target, path, frame = self.flight
+            if frame + 1 < len(path):
+                self.flight = (disk, target, path, frame + 1)
+                return
+
+            # The disk has finished moving to the target tower
+            self.stacks[target].append(disk)
+            self.flight = None
+            self.position += 1
+
+        if self.position == len(self.moves):
+            self.restart()
+            return
+
+        source, target = self.moves[self.position]
+        disk = self.stacks[source].pop()
+        path = trajectories.get(source, target, len(self.stacks[source]),
+                                len(self.stacks[target]))
+        self.flight = (disk, target, path, 0)
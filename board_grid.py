@@ -0,0 +1,97 @@
+"""Module for implementation the BoardGrid class.
+"""
+import math
+
+import pygame
+
+from board import Board
+from sprite_cache import SpriteCache
+from trajectory_cache import TrajectoryCache
+
+class BoardGrid():
+    """The BoardGrid class runs many independent autoplaying puzzles at once
+    and draws them into scaled tiles. Every board starts at its own point
+    of the moves sequence. All the boards share the same sprites and disk
+    flight paths.
+
+    Public attributes:
+        boards: list(Board) (read only) - the boards of the grid.
+    """
+    def __init__(self, size: tuple, boards_count: int, disks_count: int,
+                 towers_count: int, moves: list, sprite_cache: SpriteCache,
+                 trajectories: TrajectoryCache):
+        """Input:
+            size - a tuple(width: int, height: int) for the grid area size
+                (the same as a single board scene size);
+            boards_count - integer number of boards;
+            disks_count, towers_count - integer numbers of disks and rods
+                of each board;
+            moves - a list of tuple(source: int, target: int) move
+                representations played by every board;
+            sprite_cache - SpriteCache object for drawing;
+            trajectories - TrajectoryCache object for disk flight paths.
+        """
+        self.trajectories = trajectories
+
+        self.boards = [Board(disks_count, towers_count, moves,
+                             len(moves) * i // boards_count)
+                       for i in range(boards_count)]
+
+        width, height = size
+        columns = math.ceil(math.sqrt(boards_count))
+        rows = math.ceil(boards_count / columns)
+        # Tiles keep the aspect ratio of the scene
+        self.scale = 1 / max(columns, rows)
+        self.background, self.sprites = sprite_cache.get(self.scale)
+
+        tile_width, tile_height = width / columns, height / rows
+        self.tiles = [(int(i % columns * tile_width),
+                       int(i // columns * tile_height))
+                      for i in range(boards_count)]
+
+        # Scaled middle-bottom points of resting disks by rods and levels
+        self.rest_points = [[self._scale_point(
+                                 trajectories.get_rest_point(tower, level))
+                             for level in range(disks_count)]
+                            for tower in range(towers_count)]
+
+    def update(self):
+        """Advances every board by one frame. Should be called every frame.
+        """
+        for board in self.boards:
+            board.update(self.trajectories)
+
+    def draw(self, surface: pygame.Surface = None):
+        """Draws all the boards.
+
+        Input:
+            surface - pygame.Surface object to draw on (the display surface
+                is used by default).
+        """
+        ds = surface or pygame.display.get_surface()
+
+        blit_sequence = []
+        for board, (left, top) in zip(self.boards, self.tiles):
+            blit_sequence.append((self.background, (left, top)))
+
+            for tower, stack in enumerate(board.stacks):
+                for level, disk in enumerate(stack):
+                    x, y = self.rest_points[tower][level]
+                    blit_sequence.append(self._place(disk, left + x, top + y))
+
+            if board.flight:
+                disk, target, path, frame = board.flight
+                x, y = self._scale_point(path[frame])
+                blit_sequence.append(self._place(disk, left + x, top + y))
+
+        ds.blits(blit_sequence, doreturn=False)
+
+    # Returns a point of the board scene scaled to the tile
+    def _scale_point(self, point: tuple) -> tuple:
+        return (round(point[0] * self.scale), round(point[1] * self.scale))
+
+    # Returns blit parameters for a disk sprite with a given middle-bottom
+    # point
+    def _place(self, disk: int, x: int, y: int) -> tuple:
+        sprite = self.sprites[disk]
+        return (sprite, (x - sprite.get_width() // 2, y - sprite.get_height()))
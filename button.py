@@ -11,6 +11,8 @@ class Button(BlinkingRect):
     Public attributes:
         caption: str (read only) - stores button caption as an identifier.
     """
+    __slots__ = ('caption', 'text_surf', 'text_rect')
+
     def __init__(self, width: int, height: int, color: tuple, text: str,
                  text_color: tuple, font: pygame.font.Font):
         """Input:
@@ -26,10 +28,11 @@ class Button(BlinkingRect):
         self.text_surf = font.render(text, True, text_color)
         self.text_rect = self.text_surf.get_rect()
 
-    def draw(self):
-        """Draws the button.
+    def draw(self, surface: pygame.Surface = None):
+        """Draws the button. The parameters are exactly the same as for
+        RoundedRect.draw() method.
         """
-        super().draw()
-        ds = pygame.display.get_surface()
+        super().draw(surface)
+        ds = surface or pygame.display.get_surface()
         self.text_rect.center = self.rect.center
         ds.blit(self.text_surf, self.text_rect)
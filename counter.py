@@ -28,6 +28,12 @@ class Counter():
         self.value = 0
         self._prepare_onscreen_text()
 
+    def set(self, value: int):
+        """Sets counter to a given value.
+        """
+        self.value = value
+        self._prepare_onscreen_text()
+
     def increment(self):
         """Increments counter value by 1.
         """
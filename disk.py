@@ -5,29 +5,68 @@ import math
 import pygame
 
 from blinking_rect import BlinkingRect
-
-MOVING_SPEED = 10 # Disk animation moving speed: pixels per frame
-
-# Constants for disk animation phases
-MOVING_PHASE_STARTING = 0
-MOVING_PHASE_FLYING = 1
-MOVING_PHASE_LANDING = 2
+from disk_animator import DiskAnimator, MOVING_PHASE_NONE
 
 class Disk(BlinkingRect):
     """The main purpose of the Disk class is to implement smooth animation for
     moving a disk object from one rod to another.
+
+    A Disk object is a lightweight view into DiskAnimator arrays, which store
+    its position, moving phase and blinking value. The animation of all disks
+    is stepped at once by DiskAnimator.update() method. The rect and blinking
+    attributes inherited from RoundedRect and BlinkingRect are replaced by
+    properties reading and writing the animator arrays.
+
+    Public attributes:
+        rect: pygame.Rect (read only) - a new copy of the disk rectangle built
+            from animation arrays at every access. Modifying its properties
+            (e.g. disk.rect.midbottom = point) has no effect;
+        midbottom: tuple(x: int, y: int) - middle-bottom point of the Disk
+            object. It is the only way of positioning the Disk object.
     """
-    def __init__(self, width: int, height: int, color: tuple):
-        """The parameters are exactly the same as for RoundedRect constructor.
+    __slots__ = ('animator', 'index')
+
+    def __init__(self, width: int, height: int, color: tuple,
+                 animator: DiskAnimator):
+        """Input:
+            width, height, color are the same as for RoundedRect constructor;
+            animator - DiskAnimator object for storing the Disk state.
         """
+        self.animator = animator
+        self.index = animator.add(width, height)
+
         super().__init__(width, height, color)
 
-        self.moving_phase = None
-        self.start_point = (None, None)
-        self.land_point = (None, None)
-        self.fly_point = (None, None)
-        self.delta = None
-        self.angle = None
+    @property
+    def rect(self) -> pygame.Rect:
+        width, height = self.animator.size[self.index]
+        rect = pygame.Rect(0, 0, int(width), int(height))
+        rect.midbottom = self.midbottom
+        return rect
+
+    # Only the size is taken (the rect is assigned by RoundedRect constructor)
+    @rect.setter
+    def rect(self, rect: pygame.Rect):
+        self.animator.size[self.index] = rect.size
+
+    @property
+    def midbottom(self) -> tuple:
+        x, y = self.animator.pos[self.index]
+        return (round(x), round(y))
+
+    @midbottom.setter
+    def midbottom(self, point: tuple):
+        self.animator.pos[self.index] = point
+
+    @property
+    def blinking(self) -> float:
+        blinking = self.animator.blinking[self.index]
+        return None if math.isnan(blinking) else float(blinking)
+
+    @blinking.setter
+    def blinking(self, blinking: float):
+        self.animator.blinking[self.index] = (math.nan if blinking is None
+                                              else blinking)
 
     def move(self, start_point: tuple, land_point: tuple, fly_point: tuple):
         """Initializes moving animation (should be called once per full cycle).
@@ -40,50 +79,20 @@ class Disk(BlinkingRect):
             fly_point - a tuple(x: int, y: int) for middle-bottom point
                 of the Disk object where it starts curvilinear motion.
         """
-        self.rect.midbottom = start_point
-        self.start_point = start_point
-        self.land_point = land_point
-        self.fly_point = fly_point
-        self.angle = 0
-        self.moving_phase = MOVING_PHASE_STARTING
+        self.animator.move(self.index, start_point, land_point, fly_point)
 
-    def is_moving(self) -> bool:
-        """Returns True if the animation is in progress and False otherwise.
+    def stop_moving(self):
+        """Cancels moving animation (the Disk object stays where it is).
         """
-        return self.moving_phase != None
+        self.animator.stop(self.index)
 
     def update(self):
-        """Updates coordinates of the Disk object while the animation is in
-        progress. Should be called every frame.
+        """Does nothing: the Disk object is updated by DiskAnimator.update()
+        method along with all other disks. It is safe to call it every frame
+        like update() of any other BlinkingRect object.
+        """
+
+    def is_moving(self) -> bool:
+        """Returns True if the animation is in progress and False otherwise.
         """
-        super().update()
-
-        if self.moving_phase == MOVING_PHASE_STARTING:
-            self.rect.y -= MOVING_SPEED
-
-            if self.rect.bottom <= self.fly_point[1]:
-                self.rect.midbottom = self.fly_point
-                self.delta = 2 * MOVING_SPEED / (self.start_point[0]
-                                                 - self.land_point[0])
-                self.angle = 0 if self.delta > 0 else math.pi
-                self.moving_phase = MOVING_PHASE_FLYING
-
-        elif self.moving_phase == MOVING_PHASE_FLYING:
-            self.angle += self.delta
-            radius = abs(self.start_point[0] - self.land_point[0]) / 2
-            x0 = (self.start_point[0] + self.land_point[0]) / 2
-            y0 = self.fly_point[1]
-            self.rect.centerx = radius * math.cos(self.angle) + x0
-            self.rect.bottom = y0 - radius * math.sin(self.angle) / 2
-
-            if ((self.delta > 0 and self.angle >= math.pi)
-                    or (self.delta < 0 and self.angle <= 0)):
-                self.rect.centerx = self.land_point[0]
-                self.rect.bottom = self.fly_point[1]
-                self.moving_phase = MOVING_PHASE_LANDING
-
-        elif self.moving_phase == MOVING_PHASE_LANDING:
-            self.rect.y += MOVING_SPEED
-            if self.rect.bottom >= self.land_point[1]:
-                self.rect.midbottom = self.land_point
-                self.moving_phase = None
+        return self.animator.phase[self.index] != MOVING_PHASE_NONE
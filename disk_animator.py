@@ -0,0 +1,153 @@
+"""Module for implementation the DiskAnimator class.
+"""
+import math
+
+import numpy as np
+
+from blinking_rect import BLINKING_SPEED
+
+MOVING_SPEED = 10 # Disk animation moving speed: pixels per frame
+INITIAL_CAPACITY = 16 # Initial count of disk slots in animation arrays
+
+# Constants for disk animation phases
+MOVING_PHASE_NONE = -1
+MOVING_PHASE_STARTING = 0
+MOVING_PHASE_FLYING = 1
+MOVING_PHASE_LANDING = 2
+
+class DiskAnimator():
+    """The DiskAnimator class keeps positions, moving phases and blinking
+    values of many Disk objects in contiguous NumPy arrays (one row per disk)
+    and steps all active animations at once with a single vectorized update.
+
+    Public attributes:
+        count: int (read only) - number of occupied disk slots;
+        pos: numpy.ndarray (read only) - (x, y) middle-bottom points;
+        size: numpy.ndarray (read only) - (width, height) of disks;
+        phase: numpy.ndarray (read only) - moving phases;
+        blinking: numpy.ndarray (read only) - blinking values (NaN for
+            non-blinking disks).
+    """
+    arc_sampling = 1.0 # Class-wide setting: lower values for coarser arcs
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        """Input:
+            capacity - initial count of disk slots (the arrays grow
+                automatically when more disks are added).
+        """
+        self.count = 0
+        self._allocate(max(capacity, 1))
+
+    def add(self, width: int, height: int) -> int:
+        """Allocates a slot for a new disk.
+
+        Input:
+            width, height - integer values for disk size.
+        Returns:
+            Integer index of the slot allocated.
+        """
+        if self.count == len(self.phase):
+            self._allocate(2 * len(self.phase))
+
+        index = self.count
+        self.count += 1
+
+        self.pos[index] = 0
+        self.size[index] = (width, height)
+        self.phase[index] = MOVING_PHASE_NONE
+        self.blinking[index] = np.nan
+
+        return index
+
+    def move(self, index: int, start_point: tuple, land_point: tuple,
+             fly_point: tuple):
+        """Initializes moving animation for the disk at a given slot. The
+        parameters are exactly the same as for Disk.move() method.
+        """
+        self.pos[index] = start_point
+        self.start[index] = start_point
+        self.land[index] = land_point
+        self.fly[index] = fly_point
+        self.angle[index] = 0
+        self.phase[index] = MOVING_PHASE_STARTING
+
+    def stop(self, index: int):
+        """Cancels moving animation for the disk at a given slot (the disk
+        stays where it is).
+        """
+        self.phase[index] = MOVING_PHASE_NONE
+
+    def is_moving(self) -> bool:
+        """Returns True if any animation is in progress and False otherwise.
+        """
+        return bool(np.any(self.phase[:self.count] != MOVING_PHASE_NONE))
+
+    def update(self):
+        """Updates coordinates and blinking values of all disks. Should be
+        called every frame.
+        """
+        n = self.count
+        pos, phase = self.pos[:n], self.phase[:n]
+        start, land, fly = self.start[:n], self.land[:n], self.fly[:n]
+        delta, angle = self.delta[:n], self.angle[:n]
+
+        blinking = self.blinking[:n]
+        blinking += BLINKING_SPEED # NaN values stay untouched
+        np.subtract(blinking, math.pi, out=blinking,
+                    where=blinking >= math.pi)
+
+        # Masks are taken before any change, so that each disk is able
+        # to pass no more than one phase per frame
+        starting = phase == MOVING_PHASE_STARTING
+        flying = phase == MOVING_PHASE_FLYING
+        landing = phase == MOVING_PHASE_LANDING
+
+        if starting.any():
+            pos[starting, 1] -= MOVING_SPEED
+
+            done = starting & (pos[:, 1] <= fly[:, 1])
+            pos[done] = fly[done]
+            delta[done] = (2 * MOVING_SPEED / self.arc_sampling
+                           / (start[done, 0] - land[done, 0]))
+            angle[done] = np.where(delta[done] > 0, 0, math.pi)
+            phase[done] = MOVING_PHASE_FLYING
+
+        if flying.any():
+            angle[flying] += delta[flying]
+            radius = np.abs(start[flying, 0] - land[flying, 0]) / 2
+            x0 = (start[flying, 0] + land[flying, 0]) / 2
+            y0 = fly[flying, 1]
+            pos[flying, 0] = radius * np.cos(angle[flying]) + x0
+            pos[flying, 1] = y0 - radius * np.sin(angle[flying]) / 2
+
+            done = flying & (((delta > 0) & (angle >= math.pi))
+                             | ((delta < 0) & (angle <= 0)))
+            pos[done, 0] = land[done, 0]
+            pos[done, 1] = fly[done, 1]
+            phase[done] = MOVING_PHASE_LANDING
+
+        if landing.any():
+            pos[landing, 1] += MOVING_SPEED
+
+            done = landing & (pos[:, 1] >= land[:, 1])
+            pos[done] = land[done]
+            phase[done] = MOVING_PHASE_NONE
+
+    # (Re)allocates animation arrays keeping the occupied slots
+    def _allocate(self, capacity: int):
+        arrays = {
+            'pos': np.zeros((capacity, 2)),
+            'size': np.zeros((capacity, 2), dtype=np.int32),
+            'phase': np.full(capacity, MOVING_PHASE_NONE, dtype=np.int8),
+            'start': np.zeros((capacity, 2)),
+            'land': np.zeros((capacity, 2)),
+            'fly': np.zeros((capacity, 2)),
+            'delta': np.zeros(capacity),
+            'angle': np.zeros(capacity),
+            'blinking': np.full(capacity, np.nan),
+        }
+
+        for name, array in arrays.items():
+            if self.count:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
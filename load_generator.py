@@ -0,0 +1,116 @@
+"""This is the load generator for the Tower of Hanoi solver and query service
+(see pyramid_server.py). It sends batched random queries from a number
+of concurrent keep-alive connections and reports requests per second and
+latency percentiles. Every query gets a random number of disks (up to 64
+by default), so both small and large configurations are exercised.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from pyramid_server import HOST, MAX_DISKS_COUNT, PORT, TOWERS_COUNT
+
+CONNECTIONS = 8
+REQUESTS = 1000 # Requests per connection
+BATCH_SIZE = 16 # Queries per request
+DISKS_COUNT = MAX_DISKS_COUNT # Maximal number of disks in queries
+SOLVE_LIMITS = [16, 256, 4096] # Solution lengths asked by solve queries
+PERCENTILES = [50, 90, 99, 100]
+
+# Returns a random query for the given number of disks
+def random_query(disks_count: int) -> dict:
+    def random_config():
+        return [random.randrange(TOWERS_COUNT) for i in range(disks_count)]
+
+    query_type = random.choice(['move', 'solve', 'hint', 'validate'])
+    if query_type == 'move':
+        return {'type': 'move', 'disks': disks_count,
+                'k': random.randint(1, 2 ** disks_count - 1)}
+    elif query_type == 'validate':
+        moves = [random.sample(range(TOWERS_COUNT), 2) for i in range(8)]
+        return {'type': 'validate', 'state': random_config(), 'moves': moves}
+    elif query_type == 'solve':
+        return {'type': 'solve', 'state': random_config(),
+                'goal': random_config(), 'limit': random.choice(SOLVE_LIMITS)}
+    else:
+        return {'type': query_type, 'state': random_config(),
+                'goal': random_config()}
+
+# Sends requests through a single connection and collects their latencies
+async def run_connection(args: argparse.Namespace, latencies: list):
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+
+    for i in range(args.requests):
+        body = json.dumps({'queries': [
+            random_query(random.randint(1, args.disks))
+            for j in range(args.batch)]}).encode()
+        request = ('POST / HTTP/1.1\r\n'
+                   'Host: {}\r\n'
+                   'Content-Type: application/json\r\n'
+                   'Content-Length: {}\r\n\r\n'.format(args.host, len(body))
+                   ).encode('latin-1') + body
+
+        start = time.perf_counter()
+        writer.write(request)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        content_length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.strip().lower() == 'content-length':
+                content_length = int(value)
+        await reader.readexactly(content_length)
+        latencies.append(time.perf_counter() - start)
+
+        if b' 200 ' not in status_line:
+            raise RuntimeError('server error: {}'.format(
+                status_line.decode('latin-1').strip()))
+
+    writer.close()
+
+# Runs all the connections and prints the report
+async def run(args: argparse.Namespace):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*[run_connection(args, latencies)
+                           for i in range(args.connections)])
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print('{} requests ({} queries each) in {:.2f} s'.format(
+        len(latencies), args.batch, elapsed))
+    print('{:.1f} requests/s, {:.1f} queries/s'.format(
+        len(latencies) / elapsed, len(latencies) * args.batch / elapsed))
+    for percentile in PERCENTILES:
+        index = min(len(latencies) * percentile // 100, len(latencies) - 1)
+        print('p{:<3} latency: {:.2f} ms'.format(
+            percentile, latencies[index] * 1000))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Load generator for the Tower of Hanoi query service')
+    parser.add_argument('--host', default=HOST, help='server address')
+    parser.add_argument('--port', type=int, default=PORT, help='server port')
+    parser.add_argument('--unix', metavar='PATH',
+                        help='server Unix socket path instead of TCP address')
+    parser.add_argument('--connections', type=int, default=CONNECTIONS,
+                        help='number of concurrent connections')
+    parser.add_argument('--requests', type=int, default=REQUESTS,
+                        help='number of requests per connection')
+    parser.add_argument('--batch', type=int, default=BATCH_SIZE,
+                        help='number of queries per request')
+    parser.add_argument('--disks', type=int, default=DISKS_COUNT,
+                        help='maximal number of disks in queries')
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
@@ -0,0 +1,152 @@
+"""Module for implementation the MoveHistory class.
+"""
+from array import array
+
+SNAPSHOT_INTERVAL = 256 # Moves between full state snapshots
+
+class MoveHistory():
+    """The MoveHistory class stores the moves made for undo and redo. Every
+    move is packed into a single byte, and a full state snapshot is taken
+    every SNAPSHOT_INTERVAL moves, so any position of the history can be
+    restored by replaying no more than SNAPSHOT_INTERVAL moves.
+
+    The state is represented as a sequence of rod indexes, one per disk
+    (from the largest disk to the smallest one).
+
+    Public attributes:
+        moves: array.array (read only) - packed moves (both done and undone);
+        position: int (read only) - the number of moves done;
+        state: bytearray (read only) - the state at the current position.
+    """
+    def __init__(self, state: list, towers_count: int,
+                 snapshot_interval: int = SNAPSHOT_INTERVAL):
+        """Input:
+            state - a list of rod indexes for the initial state;
+            towers_count - integer number of rods;
+            snapshot_interval - integer number of moves between snapshots.
+        """
+        self.towers_count = towers_count
+        self.snapshot_interval = snapshot_interval
+        self.moves = array('B')
+        self.position = 0
+        self.state = bytearray(state)
+        self.snapshots = [bytes(self.state)]
+
+    def restore(self, moves: bytes, position: int, state: list,
+                snapshots: list):
+        """Restores previously saved history at once (no moves are replayed).
+
+        Input:
+            moves - bytes of packed moves (as stored by moves attribute);
+            position - integer number of moves done;
+            state - a list of rod indexes for the state at the position;
+            snapshots - a list of rod indexes lists for the snapshots (one per
+                snapshot_interval moves, starting with the initial state).
+        """
+        self.moves = array('B', moves)
+        self.position = position
+        self.state = bytearray(state)
+        self.snapshots = [bytes(snapshot) for snapshot in snapshots]
+
+    def push(self, source: int, target: int):
+        """Appends the move to the current position. All the undone moves
+        are discarded.
+
+        Input:
+            source, target - integer indexes of source and target rods.
+        """
+        del self.moves[self.position:]
+        del self.snapshots[self.position // self.snapshot_interval + 1:]
+
+        self.moves.append(source * self.towers_count + target)
+        self._apply(source, target)
+        self.position += 1
+
+        if self.position % self.snapshot_interval == 0:
+            self.snapshots.append(bytes(self.state))
+
+    def can_undo(self) -> bool:
+        """Returns True if there is a move to undo and False otherwise.
+        """
+        return self.position > 0
+
+    def can_redo(self) -> bool:
+        """Returns True if there is a move to redo and False otherwise.
+        """
+        return self.position < len(self.moves)
+
+    def undo(self) -> tuple:
+        """Takes back the last move done.
+
+        Returns:
+            A tuple(source: int, target: int) for the move undone, i.e.
+            the disk must be moved from target rod to source one;
+            None - if there is nothing to undo.
+        Raises:
+            ValueError - if the move is illegal (for a restored history).
+        """
+        if not self.can_undo():
+            return None
+
+        source, target = self._unpack(self.moves[self.position - 1])
+        self._apply(target, source)
+        self.position -= 1
+        return (source, target)
+
+    def redo(self) -> tuple:
+        """Makes again the last move undone.
+
+        Returns:
+            A tuple(source: int, target: int) for the move redone;
+            None - if there is nothing to redo.
+        Raises:
+            ValueError - if the move is illegal (for a restored history).
+        """
+        if not self.can_redo():
+            return None
+
+        source, target = self._unpack(self.moves[self.position])
+        self._apply(source, target)
+        self.position += 1
+        return (source, target)
+
+    def jump(self, position: int) -> bytearray:
+        """Moves to any position of the history at once. The nearest snapshot
+        is restored and the rest of moves are replayed.
+
+        Input:
+            position - integer number of moves done at the desired position
+                (clipped to the history bounds).
+        Returns:
+            The state at the new position.
+        Raises:
+            ValueError - if any move replayed is illegal (for a restored
+                history). The history stays at the previous position then.
+        """
+        position = max(0, min(position, len(self.moves)))
+
+        state = self.state
+        snapshot = position // self.snapshot_interval
+        self.state = bytearray(self.snapshots[snapshot])
+        try:
+            for move in self.moves[snapshot * self.snapshot_interval:
+                                   position]:
+                self._apply(*self._unpack(move))
+        except ValueError:
+            self.state = state
+            raise
+        self.position = position
+
+        return self.state
+
+    # Returns tuple(source, target) for the packed move
+    def _unpack(self, move: int) -> tuple:
+        return divmod(move, self.towers_count)
+
+    # Moves the topmost (i.e. the smallest) disk between rods in the state
+    # Note: ValueError is raised for an illegal move (the state is untouched)
+    def _apply(self, source: int, target: int):
+        disk = self.state.rindex(source)
+        if source == target or target in self.state[disk + 1:]:
+            raise ValueError('illegal move')
+        self.state[disk] = target
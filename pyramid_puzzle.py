@@ -1,10 +1,21 @@
 """This is the Tower of Hanoi puzzle (also known as pyramid puzzle). Here's
 the main program script to be run.
 """
+import argparse
+
 import pygame
 from pygame.locals import *
 
+from board_grid import BoardGrid
+from sprite_cache import SpriteCache
+from trajectory_cache import TrajectoryCache
 from disk import Disk
+from disk_animator import DiskAnimator
+from move_history import MoveHistory
+from quality_governor import QualityGovernor
+from session_file import SessionError, SessionFile
+from state_graph import StateGraph
+from solver import Solver
 from tower import Tower
 from counter import Counter
 from button import Button
@@ -43,10 +54,13 @@ WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 INDIGO = (26, 35, 126)
 ORANGE = (230, 81, 0)
+TEAL = (0, 150, 136)
 BROWN = (121, 85, 72)
 BGCOLOR = WHITE
 ROD_COLOR = BROWN
 
+SESSION_FILE = 'pyramid_puzzle.sav'
+
 FONT_NAME = 'freesansbold.ttf'
 BASIC_FONT_SIZE = 24
 
@@ -62,6 +76,9 @@ HELP_LINES = [
     'Also you can use numeric keyboard buttons for quick selecting.',
     'F1 - help screen | F2 - automatic solution | F3 - reset puzzle',
     'F4 - quit the game | F11 - toggle fullscreen | ESC - cancel selection',
+    'F5 - grid mode (+/- change boards count) | F6 - state graph view',
+    'F12 - debug info (rendering quality and frame time)',
+    'Ctrl+Z / Ctrl+Y - undo / redo | PgUp, PgDn, Home, End - history jump',
     '',
     'Press any key to continue...',
 ]
@@ -79,11 +96,46 @@ VICTORY_FONT_SIZE = 32
 COUNTER_PREFIX_TEXT = 'Steps: '
 COUNTER_TEXT_COLOR = INDIGO
 
+GRAPH_COLORS = {
+    'background': BGCOLOR,
+    'node': BROWN,
+    'path': ORANGE,
+    'position': INDIGO,
+    'goal': TEAL,
+}
+
+DEBUG_READOUT_INTERVAL = FPS // 4 # Frames between debug readout updates
+DEBUG_READOUT_TEXT = 'Quality: {} ({}) | Frame time: {:.1f} ms'
+DEBUG_TEXT_COLOR = INDIGO
+
+HISTORY_JUMP = 100 # Moves to jump over by PageUp/PageDown keys
+
+GRID_BOARDS_COUNT = 16 # Default number of boards for the grid mode
+GRID_MAX_BOARDS_COUNT = 4096
+GRID_READOUT_INTERVAL = FPS # Frames between grid readout updates
+GRID_READOUT_TEXT = 'Boards: {} | Frame time: {:.1f} ms'
+GRID_TEXT_COLOR = INDIGO
+
 class PyramidPuzzle():
     """Represents the game itself. Create a class instance and execute run()
     method to start the puzzle.
     """
-    def __init__(self):
+    def __init__(self, grid_boards: int = 0, start: tuple = None,
+                 goal: tuple = None, session_path: str = None,
+                 resume: bool = False):
+        """Input:
+            grid_boards - integer number of boards to start the game in grid
+                mode with (0 means the usual single board mode, and
+                GRID_MAX_BOARDS_COUNT is the maximum);
+            start, goal - tuples of tower indexes (0 for the first tower), one
+                per disk from the largest disk to the smallest one, for
+                the initial and the goal puzzle configurations (all the disks
+                on the first and on the last tower by default);
+            session_path - file path to save the game session to when the game
+                is over (the session is not saved by default);
+            resume - True for resuming the game session saved before to
+                session_path file (if there is any).
+        """
         pygame.init()
         pygame.display.set_mode((WIN_WIDTH, WIN_HEIGHT))
         pygame.display.set_caption(WIN_CAPTION)
@@ -99,31 +151,67 @@ class PyramidPuzzle():
         self.victory_message.rect.centerx = WIN_WIDTH // 2
         self.victory_message.rect.top = 3 * MIN_SIZE
 
+        self.start = start or (0,) * DISKS_COUNT
+        self.goal = goal or (TOWERS_COUNT - 1,) * DISKS_COUNT
+        self.solver = Solver()
+
         self.steps_counter = Counter((MIN_SIZE, MIN_SIZE), COUNTER_PREFIX_TEXT,
                                      COUNTER_TEXT_COLOR, self.basic_font)
 
+        # Grid mode objects: the caches are shared by all the grids
+        self.grid = None
+        self.grid_readout = None
+        self.sprite_cache = None
+        self.trajectories = None
+        self.frame_times = {} # Boards count: [total time (ms), frames count]
+
+        # State graph view objects: the graph is built at first showing
+        self.state_graph = None
+        self.graph_view = False
+        self.graph_path_state = None
+        self.graph_path_points = []
+
+        self.governor = QualityGovernor(1000 / FPS)
+        self.debug_readout = None
+        self.debug_frames = 0
+
         self._reset()
 
+        self.session_path = session_path
+        if session_path and resume:
+            self._load_session()
+
+        if grid_boards:
+            self._start_grid(grid_boards)
+
     def run(self):
         """The only public method. Just runs the game. It starts infinite
         loop where system events are being processed and game objects
-        are being drawn.
+        are being drawn. Frame times of the grid mode (if any) are reported
+        and the game session is saved after the game is over.
         """
         self._screen_fade(reverse=True)
+        self._main_loop()
+        self._report_frame_times()
+        self._save_session()
 
+    # The infinite loop of the game
+    def _main_loop(self):
         while not pygame.event.get(QUIT):
             for event in pygame.event.get():
                 if not self._process_event(event):
                     # Program termination
                     return
 
+            if self.grid:
+                self.grid.update()
+                self._draw()
+                continue
+
             # The disk has finished moving to the target tower
             if (self.selected_disk and self.target_tower
                     and not self.selected_disk.is_moving()):
-                self.target_tower.put(self.selected_disk)
-                self.selected_disk = None
-                self.target_tower = None
-                self.steps_counter.increment()
+                self._land_disk()
 
             # Handling solution autoplay: getting the next move right after
             # the animation has finished
@@ -141,7 +229,9 @@ class PyramidPuzzle():
     def _reset(self):
         self._set_cursor(SYSTEM_CURSOR_ARROW)
 
-        self.disks = [Disk(MIN_SIZE * (i + 3), 2 * MIN_SIZE, DISK_COLORS[i])
+        self.animator = DiskAnimator(DISKS_COUNT)
+        self.disks = [Disk(MIN_SIZE * (i + 3), 2 * MIN_SIZE, DISK_COLORS[i],
+                           self.animator)
                       for i in range(DISKS_COUNT - 1, -1, -1)]
 
         self.towers = [Tower(MIN_SIZE, DISKS_COUNT * self.disks[0].rect.height
@@ -153,8 +243,7 @@ class PyramidPuzzle():
                                               * (i + 0.5))
             self.towers[i].rect.bottom = WIN_HEIGHT - 5 * MIN_SIZE
 
-        for disk in self.disks:
-            self.towers[0].put(disk)
+        self._set_state(self.start)
 
         self.bar = RoundedRect(WIN_WIDTH - 2 * MIN_SIZE, 2 * MIN_SIZE,
                                ROD_COLOR)
@@ -176,6 +265,11 @@ class PyramidPuzzle():
         self.solution_moves = []
         self.steps_counter.reset()
 
+        self.history = MoveHistory(self._get_state(), TOWERS_COUNT)
+
+        # The layout has changed: static background must be rebuilt
+        self.background = None
+
     # Sets new system cursor shape if the shape has changed
     def _set_cursor(self, cursor: int):
         if self.cursor != cursor:
@@ -184,41 +278,189 @@ class PyramidPuzzle():
 
     # Updates all internal objects having update() method
     def _update(self):
-        for disk in self.disks:
-            disk.update()
+        self.animator.update() # All the disks at once
         for button in self.buttons:
             button.update()
 
-    # Draws all visual objects, i.e. the entire game screen
-    def _draw(self, update=True):
+    # Pre-composites the static background layer: the bar, the rods and
+    # the idle (not blinking) buttons
+    def _build_background(self):
         ds = pygame.display.get_surface()
+        self.background = pygame.Surface(ds.get_size(), 0, ds)
 
-        ds.fill(BGCOLOR)
-        self.bar.draw()
+        self.background.fill(BGCOLOR)
+        self.bar.draw(self.background)
         for tower in self.towers:
-            tower.draw()
-        for disk in self.disks:
-            disk.draw()
+            tower.draw(self.background)
         for button in self.buttons:
-            button.draw()
+            # Blinking buttons are drawn idle here and over again each frame
+            blinking, button.blinking = button.blinking, None
+            button.draw(self.background)
+            button.blinking = blinking
+
+    # Draws all visual objects, i.e. the entire game screen
+    def _draw(self, update=True):
+        ds = pygame.display.get_surface()
+
+        if self.grid:
+            self._draw_grid(update)
+            return
+
+        if self.graph_view:
+            self._draw_graph()
+        else:
+            if (not self.background
+                    or self.background.get_size() != ds.get_size()):
+                self._build_background()
+
+            ds.blit(self.background, (0, 0))
+            for disk in self.disks:
+                disk.draw()
+            for button in self.buttons:
+                if button.is_blinking():
+                    button.draw()
         self.steps_counter.draw()
 
         if self._is_solved():
             self.victory_message.draw()
 
+        if self.debug_readout:
+            self.debug_readout.draw()
+
         if update:
             pygame.display.update()
             self.fps_clock.tick(FPS)
 
-    # Returns True if the puzzle is solved
+            if self.governor.add_frame(self.fps_clock.get_rawtime()):
+                # Shapes of the static background must be redrawn
+                self.background = None
+
+            if self.debug_readout:
+                self.debug_frames += 1
+                if self.debug_frames == DEBUG_READOUT_INTERVAL:
+                    self._prepare_debug_readout()
+
+    # Draws the state graph view with the live position and the optimal path
+    # to the goal
+    def _draw_graph(self):
+        state = self._get_live_state()
+
+        if state != self.graph_path_state:
+            self.graph_path_state = state
+            self.graph_path_points = self.state_graph.get_path_points(
+                state, self.solver.solve(state, self.goal))
+
+        self.state_graph.draw(state, self.goal, self.graph_path_points)
+
+    # Shows or hides the state graph view
+    def _toggle_graph_view(self):
+        if not self.state_graph:
+            self.state_graph = StateGraph(DISKS_COUNT, (WIN_WIDTH, WIN_HEIGHT),
+                                          GRAPH_COLORS)
+        self.graph_view = not self.graph_view
+        self.graph_path_state = None
+
+    # Prepares debug readout text for future drawing
+    def _prepare_debug_readout(self):
+        self.debug_readout = StaticText(
+            DEBUG_READOUT_TEXT.format(self.governor.level,
+                                      self.governor.get_name(),
+                                      self.governor.get_mean_time()),
+            DEBUG_TEXT_COLOR, self.basic_font)
+        self.debug_readout.rect.topright = (WIN_WIDTH - MIN_SIZE, MIN_SIZE)
+        self.debug_frames = 0
+
+    # Draws the grid mode screen and collects frame time statistics
+    def _draw_grid(self, update=True):
+        ds = pygame.display.get_surface()
+        ds.fill(BGCOLOR)
+        self.grid.draw(ds)
+        if self.grid_readout:
+            self.grid_readout.draw()
+
+        if not update:
+            return
+
+        pygame.display.update()
+        self.fps_clock.tick(FPS)
+
+        stats = self.frame_times.setdefault(len(self.grid.boards), [0, 0])
+        stats[0] += self.fps_clock.get_rawtime()
+        stats[1] += 1
+
+        self.grid_frames += 1
+        self.grid_time += self.fps_clock.get_rawtime()
+        if self.grid_frames == GRID_READOUT_INTERVAL:
+            self.grid_readout = StaticText(
+                GRID_READOUT_TEXT.format(len(self.grid.boards),
+                                         self.grid_time / self.grid_frames),
+                GRID_TEXT_COLOR, self.basic_font)
+            self.grid_readout.rect.topleft = (MIN_SIZE, MIN_SIZE)
+            self.grid_frames = 0
+            self.grid_time = 0
+
+    # Switches the game to the grid mode with a given number of boards
+    # (clipped to the range from 1 to GRID_MAX_BOARDS_COUNT)
+    def _start_grid(self, boards_count: int):
+        boards_count = max(1, min(boards_count, GRID_MAX_BOARDS_COUNT))
+
+        # The single board is frozen in grid mode: the moving disk (if any)
+        # is landed at once
+        if self.target_tower:
+            self._land_disk()
+        self._tower_deselect()
+        self.solution_moves = []
+        self._set_cursor(SYSTEM_CURSOR_ARROW)
+
+        if not self.sprite_cache:
+            self.sprite_cache = SpriteCache((WIN_WIDTH, WIN_HEIGHT), BGCOLOR,
+                                            [self.bar] + self.towers,
+                                            self.disks)
+            self.trajectories = TrajectoryCache(self.towers,
+                                                self.disks[0].rect.height)
+
+        # The same classical solution is autoplayed by all the boards
+        moves = self.solver.solve((0,) * DISKS_COUNT,
+                                  (TOWERS_COUNT - 1,) * DISKS_COUNT)
+
+        self.grid = BoardGrid((WIN_WIDTH, WIN_HEIGHT), boards_count,
+                              DISKS_COUNT, TOWERS_COUNT, moves,
+                              self.sprite_cache, self.trajectories)
+        self.grid_readout = None
+        self.grid_frames = 0
+        self.grid_time = 0
+
+    # Switches the game back to the single board mode
+    def _stop_grid(self):
+        self.grid = None
+        self.grid_readout = None
+
+    # Prints average frame times by boards count collected in grid mode
+    def _report_frame_times(self):
+        if not self.frame_times:
+            return
+
+        print('Grid mode frame times:')
+        for boards_count, (total, frames) in sorted(self.frame_times.items()):
+            print('{:>6} boards: {:8.2f} ms ({} frames)'.format(
+                boards_count, total / frames, frames))
+
+    # Returns True if the puzzle is solved, i.e. the goal configuration
+    # is reached
     def _is_solved(self) -> bool:
-        return len(self.towers[-1].disks) == DISKS_COUNT
+        return tuple(self._get_state()) == self.goal
 
     # Gradually fades out the screen (or vice-versa if reverse is True)
     def _screen_fade(self, reverse=False, redraw=True):
         if redraw:
             self._draw(update=False)
         ds = pygame.display.get_surface()
+
+        # Fades are skipped for low quality
+        if not self.governor.fades:
+            pygame.display.update()
+            return
+
         screenshot = pygame.Surface(ds.get_size(), 0, ds)
         screenshot.blit(ds, (0, 0))
 
@@ -234,6 +476,13 @@ class PyramidPuzzle():
 
     # Processes single system event in queue and updates game state
     def _process_event(self, event: pygame.event.Event) -> bool:
+        if self.grid:
+            return self._process_grid_event(event)
+
+        # Towers and buttons are hidden by the state graph view
+        if self.graph_view and event.type in (MOUSEMOTION, MOUSEBUTTONUP):
+            return True
+
         if event.type == MOUSEMOTION:
             # Disk blinking handling
             if not self.selected_disk:
@@ -308,9 +557,42 @@ class PyramidPuzzle():
             elif event.key == K_F4:
                 self._screen_fade()
                 return False
+            elif event.key == K_F5:
+                self._start_grid(GRID_BOARDS_COUNT)
+
+            elif event.key == K_F6:
+                self._toggle_graph_view()
+
             elif event.key == K_F11:
                 pygame.display.toggle_fullscreen()
 
+            elif event.key == K_F12:
+                if self.debug_readout:
+                    self.debug_readout = None
+                else:
+                    self._prepare_debug_readout()
+
+            elif event.key == K_z and event.mod & KMOD_CTRL:
+                if event.mod & KMOD_SHIFT:
+                    self._event_redo()
+                else:
+                    self._event_undo()
+
+            elif event.key == K_y and event.mod & KMOD_CTRL:
+                self._event_redo()
+
+            elif event.key == K_PAGEUP:
+                self._event_jump(self.history.position - HISTORY_JUMP)
+
+            elif event.key == K_PAGEDOWN:
+                self._event_jump(self.history.position + HISTORY_JUMP)
+
+            elif event.key == K_HOME:
+                self._event_jump(0)
+
+            elif event.key == K_END:
+                self._event_jump(len(self.history.moves))
+
             # Selecting tower by its number
             elif event.unicode.isnumeric():
                 index = int(event.unicode) - 1
@@ -319,6 +601,29 @@ class PyramidPuzzle():
 
         return True
 
+    # Processes single system event in grid mode
+    def _process_grid_event(self, event: pygame.event.Event) -> bool:
+        if event.type == KEYDOWN:
+            boards_count = len(self.grid.boards)
+
+            if event.key in (K_ESCAPE, K_F5):
+                self._stop_grid()
+
+            elif event.key == K_F4:
+                self._screen_fade()
+                return False
+
+            elif event.key == K_F11:
+                pygame.display.toggle_fullscreen()
+
+            elif event.key in (K_PLUS, K_EQUALS, K_KP_PLUS):
+                self._start_grid(min(2 * boards_count, GRID_MAX_BOARDS_COUNT))
+
+            elif event.key in (K_MINUS, K_KP_MINUS):
+                self._start_grid(max(boards_count // 2, 1))
+
+        return True
+
     # Returns Disk under the screen point (or None)
     def _top_disk_at_pos(self, point: tuple) -> Disk:
         return self._top_tower_disk(self._tower_at_pos(point))
@@ -372,18 +677,159 @@ class PyramidPuzzle():
         self.selected_disk = None
 
     # Prepares and starts disk moving animation
-    def _start_disk_moving(self):
+    # Note: the move is stored in the history if record is True
+    def _start_disk_moving(self, record=True):
         for source_tower in self.towers:
             if source_tower.peep() == self.selected_disk:
                 source_tower.get()
                 break
 
+        if record:
+            self.history.push(self.towers.index(source_tower),
+                              self.towers.index(self.target_tower))
+
         self.selected_disk.stop_blinking()
         self.selected_disk.move(
             start_point=self.selected_disk.rect.midbottom,
             land_point=self.target_tower.get_peak_point(),
             fly_point=source_tower.rect.midtop)
 
+    # Puts the moving disk on its target tower, cancelling the animation if
+    # it is still in progress
+    # Note: the move is already stored in the history at its start
+    def _land_disk(self):
+        self.selected_disk.stop_moving()
+        self.target_tower.put(self.selected_disk)
+        self.selected_disk = None
+        self.target_tower = None
+        self.steps_counter.set(self.history.position)
+
+    # Returns the puzzle state: a list of tower indexes for every disk (from
+    # the largest disk to the smallest one)
+    # Note: the moving disk (if any) is not taken into account
+    def _get_state(self) -> list:
+        state = [None] * DISKS_COUNT
+        for i, tower in enumerate(self.towers):
+            for disk in tower.disks:
+                state[self.disks.index(disk)] = i
+        return state
+
+    # Returns the puzzle state as a tuple, the moving disk (if any) being
+    # considered to be on its target tower already
+    def _get_live_state(self) -> tuple:
+        state = self._get_state()
+        if self.selected_disk and self.target_tower:
+            state[self.disks.index(self.selected_disk)] = self.towers.index(
+                self.target_tower)
+        return tuple(state)
+
+    # Puts all the disks on the towers according to a given state
+    def _set_state(self, state: list):
+        for tower in self.towers:
+            tower.disks.clear()
+        for disk, i in zip(self.disks, state):
+            self.towers[i].put(disk)
+
+    # Prepares the board for navigating the history: cancels selection and
+    # solution autoplay, and lands the moving disk (if any) at once
+    def _prepare_history_event(self):
+        self.solution_moves = []
+        if self.target_tower:
+            self._land_disk()
+        self._tower_deselect()
+
+    # Starts moving animation for a move taken from the history
+    def _start_history_move(self, source: int, target: int):
+        self.selected_disk = self.towers[source].peep()
+        self.target_tower = self.towers[target]
+        self._start_disk_moving(record=False)
+
+    # System event handler: undo the last move (animated backwards)
+    def _event_undo(self):
+        self._prepare_history_event()
+        if self.history.can_undo():
+            try:
+                source, target = self.history.undo()
+            except ValueError:
+                self._drop_history()
+                return
+            self._start_history_move(target, source)
+
+    # System event handler: redo the last move undone
+    def _event_redo(self):
+        self._prepare_history_event()
+        if self.history.can_redo():
+            try:
+                move = self.history.redo()
+            except ValueError:
+                self._drop_history()
+                return
+            self._start_history_move(*move)
+
+    # System event handler: jump to a given position of the history
+    def _event_jump(self, position: int):
+        self._prepare_history_event()
+        try:
+            self._set_state(self.history.jump(position))
+        except ValueError:
+            self._drop_history()
+            return
+        self.steps_counter.set(self.history.position)
+
+    # Starts a new history from the current state if the history contains
+    # an illegal move (it can come from a damaged session file only)
+    def _drop_history(self):
+        self.history = MoveHistory(self._get_state(), TOWERS_COUNT)
+        self.steps_counter.reset()
+
+    # Saves the game session to the session file (if any)
+    def _save_session(self):
+        if not self.session_path:
+            return
+
+        # The moving disk is considered to have landed already
+        steps = self.steps_counter.value
+        if self.target_tower:
+            steps = self.history.position
+
+        autoplay = [(self.towers.index(move['source_tower']),
+                     self.towers.index(move['target_tower']))
+                    for move in self.solution_moves]
+
+        # A disk missing from the towers must never happen, but the history
+        # state is consistent anyway
+        state = self._get_live_state()
+        if None in state:
+            state = tuple(self.history.state)
+            steps = self.history.position
+            autoplay = []
+
+        try:
+            SessionFile(self.start, self.goal, state, steps, self.history,
+                        autoplay).save(self.session_path)
+        except OSError:
+            pass # The session is just not saved
+
+    # Resumes the game session saved to the session file (if any)
+    def _load_session(self):
+        try:
+            session = SessionFile.load(self.session_path)
+        except (OSError, SessionError):
+            return
+
+        if len(session.state) != DISKS_COUNT:
+            return
+
+        self.start = session.start
+        self.goal = session.goal
+        self._set_state(session.state)
+        self.history = session.history
+        self.steps_counter.set(session.steps)
+        self.solution_moves = [{
+                'source_tower': self.towers[source],
+                'target_tower': self.towers[target]
+            } for source, target in session.autoplay]
+
     # System event handler: show help screen
     def _event_help(self):
         self._screen_fade()
@@ -409,6 +855,7 @@ class PyramidPuzzle():
     def _draw_help(self):
         ds = pygame.display.get_surface()
         ds.fill(BGCOLOR)
+        line_height = min(2 * MIN_SIZE, WIN_HEIGHT // (len(HELP_LINES) + 1))
         for i in range(len(HELP_LINES)):
             # For addition vertical space
             if not HELP_LINES[i]:
@@ -417,32 +864,17 @@ class PyramidPuzzle():
             text_surf = self.basic_font.render(HELP_LINES[i], True,
                                                HELP_TEXT_COLOR)
             text_rect = text_surf.get_rect()
-            text_rect.top = 2 * MIN_SIZE * (i + 1)
+            text_rect.top = line_height * (i + 1)
             text_rect.centerx = WIN_WIDTH // 2
             ds.blit(text_surf, text_rect)
 
     # System event handler: solve puzzle
     def _event_solve(self):
         self._event_reset()
-        self._generate_solution(
-            DISKS_COUNT,
-            source=self.towers[0],
-            target=self.towers[2],
-            buf=self.towers[1])
-
-    # "Classical" recursive algorithm for solving the Tower of Hanoi puzzle
-    # Note: solution_moves list must be empty before this method call
-    def _generate_solution(self, n: int, source: Tower, target: Tower,
-                           buf: Tower) -> list:
-        if n != 0:
-            self._generate_solution(n - 1, source, buf, target)
-
-            self.solution_moves.append({
-                'source_tower': source,
-                'target_tower': target
-            })
-
-            self._generate_solution(n - 1, buf, target, source)
+        self.solution_moves = [{
+                'source_tower': self.towers[source],
+                'target_tower': self.towers[target]
+            } for source, target in self.solver.solve(self.start, self.goal)]
 
     # System event handler: reset game
     def _event_reset(self):
@@ -451,5 +883,43 @@ class PyramidPuzzle():
         self._screen_fade(reverse=True)
 
 
+# Parses command line boards count for the grid mode (0 for the single board
+# mode)
+def boards_count(value: str) -> int:
+    if not value.isdigit() or int(value) > GRID_MAX_BOARDS_COUNT:
+        raise argparse.ArgumentTypeError(
+            'expected a number from 0 to {}'.format(GRID_MAX_BOARDS_COUNT))
+    return int(value)
+
+# Parses command line configuration: tower numbers (starting from 1) for every
+# disk from the largest one to the smallest one, e.g. 11111113
+def configuration(value: str) -> tuple:
+    if (len(value) != DISKS_COUNT
+            or not all(c.isdigit() and 1 <= int(c) <= TOWERS_COUNT
+                       for c in value)):
+        raise argparse.ArgumentTypeError(
+            'expected {} tower numbers from 1 to {}'.format(DISKS_COUNT,
+                                                            TOWERS_COUNT))
+    return tuple(int(c) - 1 for c in value)
+
+
 if __name__ == '__main__':
-    PyramidPuzzle().run()
+    parser = argparse.ArgumentParser(description=WIN_CAPTION)
+    parser.add_argument('--grid', type=boards_count, default=0,
+                        metavar='BOARDS',
+                        help='start in grid mode with a given number of '
+                             'autoplaying boards')
+    parser.add_argument('--start', type=configuration,
+                        help='initial configuration: tower numbers for every '
+                             'disk from the largest one to the smallest one')
+    parser.add_argument('--goal', type=configuration,
+                        help='goal configuration in the same format')
+    parser.add_argument('--new', action='store_true',
+                        help="don't resume the game session saved before")
+    args = parser.parse_args()
+
+    # A new training puzzle doesn't resume the saved session
+    resume = not (args.new or args.start or args.goal)
+
+    PyramidPuzzle(grid_boards=args.grid, start=args.start, goal=args.goal,
+                  session_path=SESSION_FILE, resume=resume).run()
@@ -0,0 +1,286 @@
+"""This is the headless Tower of Hanoi solver and query service. Here's
+the server script to be run. It doesn't need pygame and can be used by other
+tools for getting solutions and validating moves.
+
+The server speaks plain HTTP/1.1 (with keep-alive) over TCP or a Unix socket.
+Every POST request carries a batch of queries as JSON:
+    {"queries": [{"type": "move", "disks": 8, "k": 5}, ...]}
+and gets a batch of results in the same order:
+    {"results": [{"move": [0, 1]}, ...]}
+
+Configurations are lists of rod indexes (0, 1 or 2), one per disk, from
+the largest disk to the smallest one. Moves are [source, target] pairs
+of rod indexes. Query types:
+    move - the k-th move of the classical solution for a number of disks:
+        {"type": "move", "disks": 8, "k": 5};
+    solve - the optimal solution from state to goal (the entire stack on
+        the last rod by default), truncated to limit moves (65536 at most):
+        {"type": "solve", "state": [0, 2, 1], "goal": [2, 2, 2], "limit": 10};
+    hint - the first move of the optimal solution from state to goal:
+        {"type": "hint", "state": [0, 2, 1]};
+    validate - checks moves played from state and reports whether the goal
+        is reached: {"type": "validate", "state": [0, 0], "moves": [[0, 1]]}.
+A query failed gets {"error": "..."} result. Recent results are kept
+in an LRU cache. Batches are answered in worker threads, so a batch of large
+configurations doesn't hold up the other connections.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import functools
+import json
+
+from solver import Solver
+
+HOST = '127.0.0.1'
+PORT = 8765
+TOWERS_COUNT = 3
+MAX_DISKS_COUNT = 64
+MAX_SOLUTION_MOVES = 2 ** 16 # Longer solutions must be truncated by limit
+CACHE_SIZE = 4096 # Number of recent query results to keep
+WORKERS = 4 # Number of threads answering batches
+
+HTTP_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+}
+
+class QueryError(Exception):
+    """Raised for malformed queries. The message is reported to the client.
+    """
+
+class PyramidServer():
+    """Represents the solver and query service. Create a class instance
+    and execute run() method to start serving.
+    """
+    def __init__(self, cache_size: int = CACHE_SIZE,
+                 workers: int = WORKERS):
+        """Input:
+            cache_size - integer number of recent query results to keep;
+            workers - integer number of threads answering batches.
+        """
+        self.solver = Solver()
+        self.answer = functools.lru_cache(maxsize=cache_size)(self._answer)
+        self.workers = workers
+
+    def run(self, host: str = HOST, port: int = PORT, path: str = None):
+        """Runs the server forever.
+
+        Input:
+            host, port - TCP address to listen at;
+            path - Unix socket path to listen at instead of TCP address.
+        """
+        asyncio.run(self._serve(host, port, path))
+
+    def process(self, queries: list) -> list:
+        """Answers a batch of queries.
+
+        Input:
+            queries - a list of query dictionaries.
+        Returns:
+            A list of result dictionaries (in the same order).
+        """
+        results = []
+        for query in queries:
+            try:
+                # Queries are normalized, so that equal ones hit the cache
+                key = json.dumps(query, sort_keys=True, separators=(',', ':'))
+                results.append(self.answer(key))
+            except (QueryError, TypeError, ValueError) as e:
+                results.append({'error': str(e)})
+        return results
+
+    # Starts listening and serves connections forever
+    async def _serve(self, host: str, port: int, path: str):
+        self.executor = concurrent.futures.ThreadPoolExecutor(self.workers)
+
+        if path:
+            server = await asyncio.start_unix_server(self._handle, path)
+        else:
+            server = await asyncio.start_server(self._handle, host, port)
+
+        with self.executor:
+            async with server:
+                await server.serve_forever()
+
+    # Serves HTTP requests of a single (keep-alive) connection
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(
+                    int(headers.get('content-length', 0)))
+                status, response = await self._respond(request_line, body)
+
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                writer.write(
+                    'HTTP/1.1 {} {}\r\n'
+                    'Content-Type: application/json\r\n'
+                    'Content-Length: {}\r\n'
+                    'Connection: {}\r\n\r\n'.format(
+                        status, HTTP_REASONS[status], len(response),
+                        'keep-alive' if keep_alive else 'close'
+                    ).encode('latin-1') + response)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    # Returns a tuple(status: int, body: bytes) for the HTTP request
+    # Note: the queries are answered in a worker thread, so that the event
+    # loop keeps serving other connections meanwhile
+    async def _respond(self, request_line: bytes, body: bytes) -> tuple:
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3:
+            return self._error(400, 'malformed request line')
+
+        method, target, version = parts
+        if target != '/':
+            return self._error(404, 'unknown path')
+        if method != 'POST':
+            return self._error(405, 'POST method expected')
+
+        try:
+            queries = json.loads(body)['queries']
+            if not isinstance(queries, list):
+                raise TypeError
+        except (ValueError, KeyError, TypeError):
+            return self._error(400, 'JSON object with queries list expected')
+
+        response = await asyncio.get_running_loop().run_in_executor(
+            self.executor, self._process_batch, queries)
+        return (200, response)
+
+    # Answers a batch of queries and returns the encoded response body
+    def _process_batch(self, queries: list) -> bytes:
+        return json.dumps({'results': self.process(queries)}).encode()
+
+    # Returns a tuple(status: int, body: bytes) for the HTTP error
+    def _error(self, status: int, message: str) -> tuple:
+        return (status, json.dumps({'error': message}).encode())
+
+    # Answers the normalized query (the results are cached by the key)
+    def _answer(self, key: str) -> dict:
+        query = json.loads(key)
+        if not isinstance(query, dict):
+            raise QueryError('query must be an object')
+
+        query_type = query.get('type')
+
+        if query_type == 'move':
+            disks_count = self._get_int(query, 'disks', 1, MAX_DISKS_COUNT)
+            k = self._get_int(query, 'k', 1, 2 ** disks_count - 1)
+            return {'move': list(self.solver.move(disks_count, k))}
+
+        if query_type not in ('solve', 'hint', 'validate'):
+            raise QueryError('unknown query type: {}'.format(query_type))
+
+        state = self._get_config(query, 'state')
+        goal = self._get_config(query, 'goal', len(state))
+
+        if query_type == 'solve':
+            cost = self.solver.cost(state, goal)
+            limit = self._get_int(query, 'limit', 0, MAX_SOLUTION_MOVES,
+                                  default=min(cost, MAX_SOLUTION_MOVES))
+            moves = self.solver.solve(state, goal, limit)
+            return {'cost': cost, 'moves': [list(move) for move in moves]}
+
+        elif query_type == 'hint':
+            move = self.solver.next_move(state, goal)
+            return {'cost': self.solver.cost(state, goal),
+                    'move': list(move) if move else None}
+
+        return self._validate(state, goal, query.get('moves'))
+
+    # Plays moves from the state and returns the validation result
+    def _validate(self, state: tuple, goal: tuple, moves: list) -> dict:
+        if not isinstance(moves, list):
+            raise QueryError('moves list expected')
+
+        state = list(state)
+        for i, move in enumerate(moves):
+            if (not isinstance(move, list) or len(move) != 2
+                    or not all(self._is_rod(rod) for rod in move)):
+                raise QueryError('malformed move #{}'.format(i))
+
+            source, target = move
+            if source not in state:
+                return {'valid': False, 'index': i, 'reason': 'empty rod',
+                        'state': state}
+
+            # The topmost disk is the smallest one, i.e. the last in state
+            disk = len(state) - 1 - state[::-1].index(source)
+            if target in state[disk + 1:] or source == target:
+                return {'valid': False, 'index': i,
+                        'reason': 'illegal move', 'state': state}
+            state[disk] = target
+
+        return {'valid': True, 'solved': tuple(state) == goal,
+                'state': state}
+
+    # Returns True if the value is a valid rod index
+    def _is_rod(self, value) -> bool:
+        return (isinstance(value, int) and not isinstance(value, bool)
+                and 0 <= value < TOWERS_COUNT)
+
+    # Returns an integer query field checked for range
+    def _get_int(self, query: dict, name: str, low: int, high: int,
+                 default: int = None) -> int:
+        value = query.get(name, default)
+        if (not isinstance(value, int) or isinstance(value, bool)
+                or not low <= value <= high):
+            raise QueryError('{} must be an integer from {} to {}'.format(
+                name, low, high))
+        return value
+
+    # Returns a configuration query field checked for legality (the entire
+    # stack on the last rod by default)
+    def _get_config(self, query: dict, name: str,
+                    disks_count: int = None) -> tuple:
+        if name not in query and disks_count is not None:
+            return (TOWERS_COUNT - 1,) * disks_count
+
+        config = query.get(name)
+        if (not isinstance(config, list)
+                or not 0 < len(config) <= MAX_DISKS_COUNT
+                or not all(self._is_rod(rod) for rod in config)
+                or disks_count is not None and len(config) != disks_count):
+            raise QueryError('{} must be a list of rod indexes for {} '
+                             'disks'.format(name, disks_count or 'all'))
+        return tuple(config)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='The Tower of Hanoi solver and query service')
+    parser.add_argument('--host', default=HOST, help='address to listen at')
+    parser.add_argument('--port', type=int, default=PORT,
+                        help='TCP port to listen at')
+    parser.add_argument('--unix', metavar='PATH',
+                        help='Unix socket path to listen at instead of TCP')
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE,
+                        help='number of recent query results to keep')
+    parser.add_argument('--workers', type=int, default=WORKERS,
+                        help='number of threads answering batches')
+    args = parser.parse_args()
+
+    PyramidServer(args.cache_size, args.workers).run(args.host, args.port,
+                                                     args.unix)
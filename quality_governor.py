@@ -0,0 +1,107 @@
+"""Module for implementation the QualityGovernor class.
+"""
+from collections import deque
+
+from blinking_rect import BlinkingRect
+from disk_animator import DiskAnimator
+from rounded_rect import RoundedRect
+
+# Quality levels: every level turns off one more feature
+QUALITY_LOW = 0 # Disk flight arc is sampled coarsely
+QUALITY_NO_FADES = 1 # Screen fades are skipped
+QUALITY_PLAIN_RECTS = 2 # Rounded rectangles are drawn as plain ones
+QUALITY_NO_BLINKING = 3 # Blinking brightness is not animated
+QUALITY_FULL = 4
+
+QUALITY_NAMES = ['low', 'no fades', 'plain rects', 'no blinking', 'full']
+
+WINDOW_SIZE = 60 # Frames in the sliding window
+STEP_DOWN_RATIO = 1.0 # Mean frame time to budget ratio to step down at
+STEP_UP_RATIO = 0.5 # Mean frame time to budget ratio to step up at
+STEP_UP_WINDOWS = 5 # Windows in a row with enough headroom to step up
+LOW_ARC_SAMPLING = 0.5 # Disk flight arc sampling for the lowest quality
+
+class QualityGovernor():
+    """The QualityGovernor class watches frame times over a sliding window
+    and steps quality down when the frame budget is exceeded. The quality
+    is stepped back up when there is enough headroom for a while. Quality
+    settings are applied to the drawing classes at once.
+
+    Public attributes:
+        level: int (read only) - current quality level;
+        fades: bool (read only) - True if screen fades are enabled.
+    """
+    def __init__(self, budget: float, window_size: int = WINDOW_SIZE):
+        """Input:
+            budget - float value for the frame time budget (ms);
+            window_size - integer number of frames in the sliding window.
+        """
+        self.budget = budget
+        self.frame_times = deque(maxlen=window_size)
+        self.headroom_windows = 0
+        self.level = QUALITY_FULL
+        self._apply()
+
+    def add_frame(self, frame_time: float) -> bool:
+        """Takes the frame time into account. Should be called every frame.
+
+        Input:
+            frame_time - float value for the frame time (ms) not counting
+                the delay for keeping the frame rate.
+        Returns:
+            True - if the quality level has changed;
+            False - otherwise.
+        """
+        self.frame_times.append(frame_time)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return False
+
+        mean_time = self.get_mean_time()
+
+        if mean_time > self.budget * STEP_DOWN_RATIO:
+            self.headroom_windows = 0
+            return self._set_level(self.level - 1)
+
+        if mean_time < self.budget * STEP_UP_RATIO:
+            self.headroom_windows += 1
+            # The window is restarted to count the next one
+            self.frame_times.clear()
+            if self.headroom_windows == STEP_UP_WINDOWS:
+                self.headroom_windows = 0
+                return self._set_level(self.level + 1)
+        else:
+            self.headroom_windows = 0
+
+        return False
+
+    def get_mean_time(self) -> float:
+        """Returns the mean frame time (ms) over the sliding window (or 0 if
+        there are no frames yet).
+        """
+        if not self.frame_times:
+            return 0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def get_name(self) -> str:
+        """Returns the name of the current quality level.
+        """
+        return QUALITY_NAMES[self.level]
+
+    # Sets the quality level (if possible) and returns True if it has changed
+    def _set_level(self, level: int) -> bool:
+        level = max(QUALITY_LOW, min(level, QUALITY_FULL))
+        if level == self.level:
+            return False
+
+        self.level = level
+        self.frame_times.clear()
+        self._apply()
+        return True
+
+    # Applies the current quality settings
+    def _apply(self):
+        BlinkingRect.animated = self.level > QUALITY_NO_BLINKING
+        RoundedRect.rounded = self.level > QUALITY_PLAIN_RECTS
+        self.fades = self.level > QUALITY_NO_FADES
+        DiskAnimator.arc_sampling = (1.0 if self.level > QUALITY_LOW
+                                     else LOW_ARC_SAMPLING)
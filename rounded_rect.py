@@ -13,8 +13,14 @@ class RoundedRect():
 
     Public attributes:
         rect: pygame.Rect (read only) - stores rectangle datastructure for
-            drawing. Its properties can be modified for positioning.
+            drawing. Its properties can be modified for positioning. Disk
+            objects are the exception: their rect is a computed copy, and
+            they are positioned by midbottom property only.
     """
+    __slots__ = ('color', 'border_color', 'rect')
+
+    rounded = True # Class-wide setting: False to draw plain rectangles
+
     def __init__(self, width: int, height: int, color: tuple):
         """Input:
             width - integer value for rectangle width;
@@ -34,17 +40,23 @@ class RoundedRect():
         inner_rect.center = self.rect.center
         return inner_rect
 
-    def draw(self):
-        """Draws rounded rectangle.
+    def get_radius(self, rect: pygame.Rect) -> int:
+        """Returns corners radius for drawing a given rectangle (0 if rounded
+        corners are turned off).
         """
-        ds = pygame.display.get_surface()
+        if self.rounded:
+            return int(rect.height / 2)
+        return 0
 
-        pygame.draw.rect(ds, self.border_color, self.rect,
-                         border_radius=int(self.rect.height / 2))
+    def draw(self, surface: pygame.Surface = None):
+        """Draws rounded rectangle.
 
-        inner_rect = self.get_inner_rect()
-        pygame.draw.rect(ds, self.color, inner_rect,
-                         border_radius=int(inner_rect.height / 2))
+        Input:
+            surface - pygame.Surface object to draw on (the display surface
+                is used by default).
+        """
+        ds = surface or pygame.display.get_surface()
+        self._draw_shape(ds, self.rect, self.color, self.border_color)
 
     def contains_point(self, point: tuple) -> bool:
         """Checks if a given point is inside the RoundedRect object area.
@@ -56,3 +68,14 @@ class RoundedRect():
             False - otherwise.
         """
         return self.rect.collidepoint(point)
+
+    # Draws the shape into a given rectangle with given colors (which may be
+    # palette indexes for 8-bit surfaces)
+    def _draw_shape(self, surface: pygame.Surface, rect: pygame.Rect,
+                    color, border_color):
+        pygame.draw.rect(surface, border_color, rect,
+                         border_radius=self.get_radius(rect))
+
+        inner_rect = rect.inflate(-2 * BORDER_WIDTH, -2 * BORDER_WIDTH)
+        pygame.draw.rect(surface, color, inner_rect,
+                         border_radius=self.get_radius(inner_rect))
@@ -0,0 +1,168 @@
+"""Module for implementation the SessionFile class.
+"""
+import struct
+
+import numpy as np
+
+from move_history import MoveHistory
+
+MAGIC = b'HNOI'
+VERSION = 1
+TOWERS_COUNT = 3
+
+# Header: magic, version, disks count, snapshot interval, steps counter,
+# history moves count, history position, snapshots count, autoplay moves count
+HEADER_FORMAT = '<4sBBIQQQQQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+RODS_PER_BYTE = 4 # Configurations take 2 bits per disk
+
+class SessionError(ValueError):
+    """Raised for malformed or incompatible session files.
+    """
+
+class SessionFile():
+    """The SessionFile class saves and loads game sessions in a compact
+    versioned binary format. Configurations are packed into 2 bits per disk,
+    and moves (of the history and of the solution autoplay) take 1 byte each,
+    the same as in MoveHistory. History snapshots are stored as well, so no
+    intermediate states are rebuilt on loading.
+
+    Public attributes:
+        start, goal, state: tuple (read only) - configurations (rod indexes
+            for every disk from the largest one to the smallest one);
+        steps: int (read only) - steps counter value;
+        history: MoveHistory (read only) - the moves history;
+        autoplay: list(tuple(source: int, target: int)) (read only) - moves
+            left to autoplay.
+    """
+    def __init__(self, start: tuple, goal: tuple, state: tuple, steps: int,
+                 history: MoveHistory, autoplay: list):
+        """The parameters are exactly the same as public attributes.
+        """
+        self.start = tuple(start)
+        self.goal = tuple(goal)
+        self.state = tuple(state)
+        self.steps = steps
+        self.history = history
+        self.autoplay = autoplay
+
+    def save(self, path: str):
+        """Saves the session to a given file.
+        """
+        history = self.history
+        autoplay = bytes(source * TOWERS_COUNT + target
+                         for source, target in self.autoplay)
+
+        header = struct.pack(
+            HEADER_FORMAT, MAGIC, VERSION, len(self.state),
+            history.snapshot_interval, self.steps, len(history.moves),
+            history.position, len(history.snapshots), len(autoplay))
+
+        with open(path, 'wb') as f:
+            f.write(header)
+            f.write(self._pack([self.start, self.goal, self.state]))
+            f.write(history.moves.tobytes())
+            f.write(self._pack(history.snapshots))
+            f.write(autoplay)
+
+    @classmethod
+    def load(cls, path: str) -> 'SessionFile':
+        """Loads a session from a given file.
+
+        Returns:
+            SessionFile instance.
+        Raises:
+            OSError - if the file can't be read;
+            SessionError - if the file is malformed or of unknown version.
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        try:
+            (magic, version, disks_count, snapshot_interval, steps,
+             moves_count, position, snapshots_count,
+             autoplay_count) = struct.unpack_from(HEADER_FORMAT, data)
+        except struct.error:
+            raise SessionError('truncated header')
+
+        if magic != MAGIC:
+            raise SessionError('not a session file')
+        if version != VERSION:
+            raise SessionError('unknown version: {}'.format(version))
+
+        config_size = -(-disks_count // RODS_PER_BYTE)
+        sizes = [3 * config_size, moves_count, snapshots_count * config_size,
+                 autoplay_count]
+        if (len(data) != HEADER_SIZE + sum(sizes) or not snapshot_interval
+                or position > moves_count
+                or snapshots_count != moves_count // snapshot_interval + 1):
+            raise SessionError('malformed session file')
+
+        chunks = []
+        offset = HEADER_SIZE
+        for size in sizes:
+            chunks.append(data[offset:offset + size])
+            offset += size
+        configs, moves, snapshots, autoplay = chunks
+
+        # Moves of a disk from a rod to itself (multiples of TOWERS_COUNT + 1)
+        # can't be packed by a legal move
+        if any(move >= TOWERS_COUNT ** 2 or move % (TOWERS_COUNT + 1) == 0
+               for move in moves + autoplay):
+            raise SessionError('malformed moves')
+
+        start, goal, state = cls._unpack(configs, 3, disks_count)
+        history = MoveHistory(start, TOWERS_COUNT, snapshot_interval)
+        history.restore(moves, position, state,
+                        cls._unpack(snapshots, snapshots_count, disks_count))
+        autoplay = [divmod(move, TOWERS_COUNT) for move in autoplay]
+        cls._check_moves(state, autoplay)
+
+        return cls(start, goal, state, steps, history, autoplay)
+
+    # Checks that moves can be played from a given configuration
+    # Note: the history moves aren't replayed on loading, they are checked
+    # by MoveHistory while navigating
+    @staticmethod
+    def _check_moves(state: tuple, moves: list):
+        state = list(state)
+        for source, target in moves:
+            if source not in state:
+                raise SessionError('move from an empty rod')
+
+            # The topmost disk is the smallest one, i.e. the last in state
+            disk = len(state) - 1 - state[::-1].index(source)
+            if target in state[disk + 1:]:
+                raise SessionError('illegal move')
+            state[disk] = target
+
+    # Returns configurations packed into 2 bits per disk (each configuration
+    # is padded to whole bytes)
+    @staticmethod
+    def _pack(configs: list) -> bytes:
+        if not configs:
+            return b''
+
+        rods = np.array([list(config) for config in configs], dtype=np.uint8)
+        padding = -rods.shape[1] % RODS_PER_BYTE
+        rods = np.pad(rods, ((0, 0), (0, padding)))
+        rods = rods.reshape(len(configs), -1, RODS_PER_BYTE)
+
+        shifts = np.arange(RODS_PER_BYTE, dtype=np.uint8) * 2
+        return np.bitwise_or.reduce(rods << shifts, axis=2).tobytes()
+
+    # Returns a list of configurations unpacked from bytes
+    @staticmethod
+    def _unpack(data: bytes, count: int, disks_count: int) -> list:
+        if not count:
+            return []
+
+        packed = np.frombuffer(data, dtype=np.uint8).reshape(count, -1)
+        shifts = np.arange(RODS_PER_BYTE, dtype=np.uint8) * 2
+        rods = (packed[:, :, np.newaxis] >> shifts) & 3
+        rods = rods.reshape(count, -1)[:, :disks_count]
+
+        if (rods >= TOWERS_COUNT).any():
+            raise SessionError('malformed configuration')
+        return [tuple(config) for config in rods.tolist()]
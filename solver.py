@@ -0,0 +1,184 @@
+"""Module for implementation the Solver class.
+"""
+STACK_CACHE_DISKS = 12 # Maximal disks count of whole stack solutions cached
+
+class Solver():
+    """The Solver class finds optimal solutions of the three rods puzzle
+    between any two legal configurations.
+
+    A configuration is represented as a tuple of rod indexes (0, 1 or 2), one
+    per disk, from the largest disk to the smallest one. Any such tuple
+    is a legal configuration, since disks on a rod are always stacked by size.
+
+    The largest disk of a subproblem either goes straight to its target rod
+    or routes through the third rod, whichever is shorter. Either way
+    the smaller disks are gathered into a whole stack and spread from it,
+    and such costs are calculated in closed form, so nothing but solutions
+    for moving a whole stack of up to STACK_CACHE_DISKS disks is cached
+    (the Solver object memory doesn't grow with the number of queries).
+    """
+    def __init__(self):
+        self.stack_moves = {}
+
+    def cost(self, source: tuple, target: tuple) -> int:
+        """Returns the minimal number of moves between two configurations.
+
+        Input:
+            source, target - tuples for source and target configurations
+                (of the same length).
+        """
+        source, target = tuple(source), tuple(target)
+
+        # Disks already placed at their target rods stay put and are skipped
+        # (the largest disk never moves in that case)
+        for i in range(len(source)):
+            if source[i] != target[i]:
+                break
+        else:
+            return 0
+
+        return min(self._route_costs(source[i:], target[i:]))
+
+    def solve(self, source: tuple, target: tuple, limit: int = None) -> list:
+        """Returns the optimal solution between two configurations.
+
+        Input:
+            source, target - tuples for source and target configurations
+                (of the same length);
+            limit - integer maximal number of first moves to return (the whole
+                solution is returned by default).
+        Returns:
+            A list of tuple(source: int, target: int) move representations.
+        """
+        moves = []
+        self._solve(tuple(source), tuple(target), moves,
+                    self.cost(source, target) if limit is None else limit)
+        return moves
+
+    def next_move(self, source: tuple, target: tuple) -> tuple:
+        """Returns the first move of the optimal solution between two
+        configurations (without building the whole solution).
+
+        Input:
+            source, target - tuples for source and target configurations
+                (of the same length).
+        Returns:
+            A tuple(source: int, target: int) move representation;
+            None - if the configurations are the same.
+        """
+        source, target = tuple(source), tuple(target)
+
+        while True:
+            while source and source[0] == target[0]:
+                source, target = source[1:], target[1:]
+            if not source:
+                return None
+
+            s, t = source[0], target[0]
+            r = 3 - s - t
+            n = len(source) - 1
+            direct, via = self._route_costs(source, target)
+
+            # The smaller disks must be moved out of the way first
+            sub_target = (r,) * n if direct <= via else (t,) * n
+            if source[1:] == sub_target:
+                return (s, t) if direct <= via else (s, r)
+            source, target = source[1:], sub_target
+
+    def move(self, disks_count: int, k: int) -> tuple:
+        """Returns the k-th move of the classical solution (the entire stack
+        goes from the first rod to the last one). The move is calculated
+        directly from the binary representation of k.
+
+        Input:
+            disks_count - integer number of disks;
+            k - integer number of the move (starting from 1).
+        Returns:
+            A tuple(source: int, target: int) move representation.
+        """
+        source, target = (k & (k - 1)) % 3, ((k | (k - 1)) + 1) % 3
+
+        # Even number of disks makes the second and the third rods swap roles
+        if disks_count % 2 == 0:
+            source, target = -source % 3, -target % 3
+
+        return (source, target)
+
+    # Appends the optimal solution to the moves list (until the list length
+    # reaches the limit)
+    def _solve(self, source: tuple, target: tuple, moves: list, limit: int):
+        while source and source[0] == target[0]:
+            source, target = source[1:], target[1:]
+        if not source or len(moves) >= limit:
+            return
+
+        s, t = source[0], target[0]
+        if (len(source) <= STACK_CACHE_DISKS
+                and source.count(s) == len(source)
+                and target.count(t) == len(target)):
+            moves.extend(self._stack_moves(len(source), s, t)[
+                :limit - len(moves)])
+            return
+
+        r = 3 - s - t
+        n = len(source) - 1
+        direct, via = self._route_costs(source, target)
+
+        if direct <= via:
+            route = [(source[1:], (r,) * n), (s, t), ((r,) * n, target[1:])]
+        else:
+            route = [(source[1:], (t,) * n), (s, r), ((t,) * n, (s,) * n),
+                     (r, t), ((s,) * n, target[1:])]
+
+        # Subproblems alternate with the moves of the largest disk
+        for i, step in enumerate(route):
+            if i % 2:
+                if len(moves) < limit:
+                    moves.append(step)
+            else:
+                self._solve(*step, moves, limit)
+
+    # Returns the cached classical solution for moving a whole stack
+    def _stack_moves(self, disks_count: int, source: int, target: int) -> list:
+        key = (disks_count, source, target)
+        moves = self.stack_moves.get(key)
+
+        if moves is None:
+            buf = 3 - source - target
+            moves = []
+            if disks_count:
+                moves.extend(self._stack_moves(disks_count - 1, source, buf))
+                moves.append((source, target))
+                moves.extend(self._stack_moves(disks_count - 1, buf, target))
+            self.stack_moves[key] = moves
+
+        return moves
+
+    # Returns a tuple(direct: int, via: int) of the costs for the largest disk
+    # going straight to its target rod and routing through the third rod
+    # Note: the largest disk must change its rod
+    def _route_costs(self, source: tuple, target: tuple) -> tuple:
+        s, t = source[0], target[0]
+        r = 3 - s - t
+        n = len(source) - 1
+
+        direct = (self._stack_cost(source[1:], r) + 1
+                  + self._stack_cost(target[1:], r))
+        via = (self._stack_cost(source[1:], t) + 1
+               + 2 ** n - 1 + 1
+               + self._stack_cost(target[1:], s))
+
+        return (direct, via)
+
+    # Returns the minimal number of moves between a configuration and
+    # the whole stack on a given rod (the same in both directions)
+    def _stack_cost(self, config: tuple, rod: int) -> int:
+        cost = 0
+        n = len(config)
+        for i, disk_rod in enumerate(config):
+            # A misplaced disk needs the smaller ones gathered on the third
+            # rod, which becomes their target then
+            if disk_rod != rod:
+                cost += 2 ** (n - 1 - i)
+                rod = 3 - disk_rod - rod
+        return cost
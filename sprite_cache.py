@@ -0,0 +1,58 @@
+"""Module for implementation the SpriteCache class.
+"""
+import pygame
+
+from rounded_rect import RoundedRect
+
+class SpriteCache():
+    """The SpriteCache class pre-renders the static scene (the bar and the
+    rods) and every disk shape once, and keeps their scaled copies for each
+    scale requested. It lets many boards be drawn with plain blits.
+    """
+    def __init__(self, size: tuple, bgcolor: tuple, static_objects: list,
+                 disks: list):
+        """Input:
+            size - a tuple(width: int, height: int) for the scene size;
+            bgcolor - tuple(r: int, g: int, b: int) for background color;
+            static_objects - a list of objects having draw() method (such as
+                RoundedRect or Tower) forming the static scene;
+            disks - a list of Disk objects (from the largest to the smallest)
+                to be used as sprite templates.
+        """
+        self.background = pygame.Surface(size)
+        self.background.fill(bgcolor)
+        for static_object in static_objects:
+            static_object.draw(self.background)
+
+        self.sprites = []
+        for disk in disks:
+            shape = RoundedRect(disk.rect.width, disk.rect.height, disk.color)
+            sprite = pygame.Surface(shape.rect.size, pygame.SRCALPHA)
+            shape.draw(sprite)
+            self.sprites.append(sprite)
+
+        self.scaled = {}
+
+    def get(self, scale: float) -> tuple:
+        """Returns scaled sprites (calculated at first call).
+
+        Input:
+            scale - float value for scaling factor.
+        Returns:
+            A tuple(background: pygame.Surface, sprites: list(pygame.Surface))
+            where sprites are ordered as disks passed to the constructor.
+        """
+        if scale not in self.scaled:
+            self.scaled[scale] = (
+                self._scale(self.background, scale).convert(),
+                [self._scale(sprite, scale).convert_alpha()
+                 for sprite in self.sprites])
+
+        return self.scaled[scale]
+
+    # Returns smoothly scaled copy of the surface
+    def _scale(self, surface: pygame.Surface, scale: float) -> pygame.Surface:
+        width, height = surface.get_size()
+        return pygame.transform.smoothscale(
+            surface, (max(round(width * scale), 1),
+                      max(round(height * scale), 1)))
@@ -0,0 +1,162 @@
+"""Module for implementation the StateGraph class.
+"""
+import math
+
+import numpy as np
+import pygame
+
+TOWERS_COUNT = 3
+MARGIN = 40 # Space around the graph (pixels)
+MARKER_RADIUS = 6 # Current and goal position markers radius (pixels)
+PATH_WIDTH = 2 # Optimal path line width (pixels)
+
+# Rod permutations for the subgraph where the largest disk is on a given rod:
+# the other two rods swap their roles
+SUBGRAPH_PERMUTATIONS = np.array([[0, 2, 1], [2, 1, 0], [1, 0, 2]])
+
+class StateGraph():
+    """The StateGraph class draws the configuration graph of the three rods
+    puzzle, which is a Sierpinski triangle with 3^n nodes. The nodes are
+    rendered once into a cached surface, and the current position with
+    the optimal path to the goal is drawn over it.
+
+    A configuration is represented as a sequence of rod indexes, one per disk,
+    from the largest disk to the smallest one. It is encoded as a base-3
+    number with the largest disk at the most significant digit.
+
+    Public attributes:
+        rect: pygame.Rect (read only) - the graph area. Its properties can be
+            modified for positioning.
+    """
+    def __init__(self, disks_count: int, size: tuple, colors: dict):
+        """Input:
+            disks_count - integer number of disks;
+            size - a tuple(width: int, height: int) for the graph area size;
+            colors - a dictionary of tuple(r: int, g: int, b: int) colors for
+                'background', 'node', 'path', 'position' and 'goal' keys.
+        """
+        self.disks_count = disks_count
+        self.colors = colors
+        self.rect = pygame.Rect((0, 0), size)
+
+        # Triangle corners for the configurations with all the disks on each
+        # rod: the first rod is at the top
+        width, height = size
+        side = min(width - 2 * MARGIN,
+                   (height - 2 * MARGIN) / math.sin(math.pi / 3))
+        top = (height - side * math.sin(math.pi / 3)) / 2
+        self.corners = np.array([
+            [width / 2, top],
+            [(width - side) / 2, height - top],
+            [(width + side) / 2, height - top],
+        ])
+
+        self.positions = self.get_positions(
+            np.arange(TOWERS_COUNT ** disks_count))
+
+        self.surf = pygame.Surface(size)
+        self.surf.fill(colors['background'])
+        pixels = pygame.surfarray.pixels3d(self.surf)
+        pixels[self.positions[:, 0], self.positions[:, 1]] = colors['node']
+        del pixels # Unlocks the surface
+
+    def get_positions(self, indexes: np.ndarray) -> np.ndarray:
+        """Calculates node coordinates for encoded configurations at once.
+
+        Input:
+            indexes - numpy.ndarray of encoded configurations.
+        Returns:
+            numpy.ndarray of (x, y) integer points relative to the graph area.
+        """
+        count = len(indexes)
+        rows = np.arange(count)
+        positions = np.zeros((count, 2))
+
+        # Current rods to corners mapping for every node
+        mapping = np.tile(np.arange(TOWERS_COUNT), (count, 1))
+
+        scale = 0.5
+        for i in range(self.disks_count - 1, -1, -1):
+            rod = indexes // TOWERS_COUNT ** i % TOWERS_COUNT
+            positions += scale * self.corners[mapping[rows, rod]]
+            mapping = np.take_along_axis(mapping,
+                                         SUBGRAPH_PERMUTATIONS[rod], axis=1)
+            scale /= 2
+
+        # Weights sum up to 1 - 2^-n: stretching makes all-on-one-rod nodes
+        # hit the corners exactly
+        positions /= 1 - 2 * scale
+
+        return np.rint(positions).astype(np.int32)
+
+    def get_index(self, state: list) -> int:
+        """Returns encoded configuration.
+
+        Input:
+            state - a sequence of rod indexes for the configuration.
+        """
+        index = 0
+        for rod in state:
+            index = index * TOWERS_COUNT + rod
+        return index
+
+    def get_path_indexes(self, state: list, moves: list) -> np.ndarray:
+        """Returns encoded configurations passed by playing moves.
+
+        Input:
+            state - a sequence of rod indexes for the initial configuration;
+            moves - a list of tuple(source: int, target: int) moves.
+        Returns:
+            numpy.ndarray of encoded configurations (starting with
+            the initial one).
+        """
+        steps = [self.get_index(state)]
+        state = list(state)
+        for source, target in moves:
+            # The topmost disk is the smallest one, i.e. the last in state
+            disk = len(state) - 1 - state[::-1].index(source)
+            state[disk] = target
+            steps.append((target - source)
+                         * TOWERS_COUNT ** (len(state) - 1 - disk))
+
+        return np.cumsum(steps)
+
+    def get_path_points(self, state: list, moves: list) -> list:
+        """Returns node coordinates along the path for drawing.
+
+        Input:
+            state - a sequence of rod indexes for the initial configuration;
+            moves - a list of tuple(source: int, target: int) moves.
+        Returns:
+            A list of [x: int, y: int] points relative to the graph area.
+        """
+        return self.get_positions(
+            self.get_path_indexes(state, moves)).tolist()
+
+    def draw(self, state: list, goal: list, path_points: list,
+             surface: pygame.Surface = None):
+        """Draws the graph with the current position, the goal and the path
+        between them.
+
+        Input:
+            state, goal - sequences of rod indexes for the current
+                and the goal configurations;
+            path_points - a list of points for the path (as returned by
+                get_path_points() method);
+            surface - pygame.Surface object to draw on (the display surface
+                is used by default).
+        """
+        ds = surface or pygame.display.get_surface()
+        ds.blit(self.surf, self.rect)
+
+        if len(path_points) > 1:
+            points = [(x + self.rect.left, y + self.rect.top)
+                      for x, y in path_points]
+            pygame.draw.lines(ds, self.colors['path'], False, points,
+                              PATH_WIDTH)
+
+        for marker_state, color in ((goal, self.colors['goal']),
+                                    (state, self.colors['position'])):
+            x, y = self.positions[self.get_index(marker_state)]
+            pygame.draw.circle(ds, color, (x + self.rect.left,
+                                           y + self.rect.top), MARKER_RADIUS)
@@ -12,6 +12,8 @@ class Tower(RoundedRect):
     Public attributes:
         disks: list(Disk) (read only) - a list of Disks strung on the rod.
     """
+    __slots__ = ('disks',)
+
     def __init__(self, width: int, height: int, color: tuple):
         """The parameters are exactly the same as for RoundedRect constructor.
         """
@@ -19,18 +21,22 @@ class Tower(RoundedRect):
 
         self.disks = []
 
-    def draw(self):
+    def draw(self, surface: pygame.Surface = None):
         """Drawing a rod.
+
+        Input:
+            surface - pygame.Surface object to draw on (the display surface
+                is used by default).
         """
-        ds = pygame.display.get_surface()
+        ds = surface or pygame.display.get_surface()
 
-        outer_radius = int(self.rect.height / 2)
+        outer_radius = self.get_radius(self.rect)
         pygame.draw.rect(ds, self.border_color, self.rect,
                          border_top_left_radius=outer_radius,
                          border_top_right_radius=outer_radius)
 
         inner_rect = self.get_inner_rect()
-        inner_radius = int(inner_rect.height / 2)
+        inner_radius = self.get_radius(inner_rect)
         pygame.draw.rect(ds, self.color, inner_rect,
                          border_top_left_radius=inner_radius,
                          border_top_right_radius=inner_radius)
@@ -84,7 +90,7 @@ class Tower(RoundedRect):
         if not self.can_put(disk):
             return False
 
-        disk.rect.midbottom = self.get_peak_point()
+        disk.midbottom = self.get_peak_point()
         self.disks.append(disk)
 
         return True
@@ -0,0 +1,69 @@
+"""Module for implementation the TrajectoryCache class.
+"""
+import numpy as np
+
+from disk_animator import DiskAnimator
+
+class TrajectoryCache():
+    """The TrajectoryCache class stores pre-calculated disk flight paths
+    between rods. All the boards sharing the same rods layout can share
+    a single cache, so that moving a disk costs just an array lookup.
+    """
+    def __init__(self, towers: list, disk_height: int):
+        """Input:
+            towers - a list of Tower objects defining the rods layout;
+            disk_height - integer value for the height of every disk.
+        """
+        self.bases = [tower.rect.midbottom for tower in towers]
+        self.fly_points = [tower.rect.midtop for tower in towers]
+        self.disk_height = disk_height
+        self.paths = {}
+
+    def get_rest_point(self, tower: int, level: int) -> tuple:
+        """Returns middle-bottom point of a disk lying on a given rod.
+
+        Input:
+            tower - integer index of the rod;
+            level - integer position of the disk in the stack (0 for the
+                lowest one).
+        Returns:
+            A tuple(x: int, y: int).
+        """
+        x, y = self.bases[tower]
+        return (x, y - level * self.disk_height)
+
+    def get(self, source: int, target: int, source_level: int,
+            target_level: int) -> np.ndarray:
+        """Returns the flight path of a disk (calculated at first call).
+
+        Input:
+            source, target - integer indexes of source and target rods;
+            source_level - integer position of the disk in the source stack;
+            target_level - integer position of the disk in the target stack
+                after landing.
+        Returns:
+            numpy.ndarray of middle-bottom points (one row per frame).
+        """
+        key = (source, target, source_level, target_level)
+        path = self.paths.get(key)
+
+        if path is None:
+            # The path is recorded by stepping a private one-disk animator
+            animator = DiskAnimator(1)
+            animator.arc_sampling = 1.0 # Paths are shared: full quality
+            index = animator.add(0, self.disk_height)
+            animator.move(index,
+                          start_point=self.get_rest_point(source,
+                                                          source_level),
+                          land_point=self.get_rest_point(target,
+                                                         target_level),
+                          fly_point=self.fly_points[source])
+            points = []
+            while animator.is_moving():
+                animator.update()
+                points.append(animator.pos[index].copy())
+
+            path = np.rint(points).astype(np.int32)
+            self.paths[key] = path
+
+        return path